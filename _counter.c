@@ -0,0 +1,138 @@
+/*
+ * Native line-classification kernel for CountMyLines.
+ *
+ * classify(buffer) -> (total, comment, code, blank, inMultiLineComment)
+ *
+ * Mirrors counter._scan_buffer byte for byte: one pass over the buffer,
+ * tracking the first and last non-whitespace byte of the current line and
+ * the multi-line comment state, classifying each line at its terminator
+ * (\n, \r or \r\n). counter.py falls back to the pure-Python scanners when
+ * this module has not been built.
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+static PyObject *
+classify(PyObject *self, PyObject *args)
+{
+    Py_buffer view;
+
+    if (!PyArg_ParseTuple(args, "y*", &view))
+        return NULL;
+
+    const unsigned char *buf = (const unsigned char *)view.buf;
+    Py_ssize_t n = view.len;
+
+    long long total = 0, comment = 0, code = 0, blank = 0;
+    int in_ml = 0;
+
+    Py_BEGIN_ALLOW_THREADS
+
+    /* first/last bound the current line's strip() result. */
+    Py_ssize_t first = -1, last = -1, line_start = 0;
+    Py_ssize_t i = 0;
+
+    while (i <= n) {
+        unsigned char c = 0;
+        int terminator;
+
+        if (i == n) {
+            /* A trailing terminator produces no extra empty line. */
+            if (line_start == n)
+                break;
+            terminator = 1;
+        }
+        else {
+            c = buf[i];
+            terminator = (c == '\n' || c == '\r');
+        }
+
+        if (terminator) {
+            total++;
+
+            if (first < 0) {
+                if (in_ml)
+                    comment++;
+                else
+                    blank++;
+            }
+            else if (buf[first] == '#') {
+                comment++;
+            }
+            else {
+                int starts_triple = 0, ends_triple = 0;
+
+                if (last - first >= 2) {
+                    /* Pack three bytes into one word and compare against
+                     * the two 24-bit constants ''' and """ branchlessly,
+                     * instead of three data-dependent byte compares. */
+                    unsigned int head = ((unsigned int)buf[first] << 16)
+                        | ((unsigned int)buf[first + 1] << 8)
+                        | buf[first + 2];
+                    unsigned int tail = ((unsigned int)buf[last - 2] << 16)
+                        | ((unsigned int)buf[last - 1] << 8)
+                        | buf[last];
+
+                    starts_triple = (head == 0x272727u) | (head == 0x222222u);
+                    ends_triple = (tail == 0x272727u) | (tail == 0x222222u);
+                }
+
+                if (starts_triple) {
+                    comment++;
+                    if (!ends_triple)
+                        in_ml = !in_ml;
+                }
+                else if (in_ml) {
+                    comment++;
+                }
+                else {
+                    code++;
+                }
+            }
+
+            first = -1;
+            last = -1;
+
+            /* Treat \r\n as a single terminator, like splitlines does. */
+            if (i < n && buf[i] == '\r' && i + 1 < n && buf[i + 1] == '\n')
+                i++;
+
+            line_start = i + 1;
+        }
+        else if (c != ' ' && c != '\t' && c != '\v' && c != '\f') {
+            if (first < 0)
+                first = i;
+            last = i;
+        }
+
+        i++;
+    }
+
+    Py_END_ALLOW_THREADS
+
+    PyBuffer_Release(&view);
+
+    return Py_BuildValue("LLLLO", total, comment, code, blank,
+                         in_ml ? Py_True : Py_False);
+}
+
+static PyMethodDef counter_methods[] = {
+    {"classify", classify, METH_VARARGS,
+     "classify(buffer) -> (total, comment, code, blank, inMultiLineComment)"},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef counter_module = {
+    PyModuleDef_HEAD_INIT,
+    "_counter",
+    "Native line-classification kernel for CountMyLines.",
+    -1,
+    counter_methods
+};
+
+PyMODINIT_FUNC
+PyInit__counter(void)
+{
+    return PyModule_Create(&counter_module);
+}
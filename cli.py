@@ -2,12 +2,103 @@
 CLI
 """
 
-from counter import Settings, LineCounter
+from __future__ import annotations
+
+import os
+import sys
+from dataclasses import dataclass, field
 from pathlib import Path
-import argparse
+
+from counter import Settings, LineCounter
 
 from errors import CommentNotClosedError
 
+# Values the boolean flags accept, mirroring StoreBoolAction below.
+_TRUE_VALUES = ('yes', 'true', 't', 'y', '1')
+_FALSE_VALUES = ('no', 'false', 'f', 'n', '0')
+
+_DEFAULT_EXCLUDES = ["venv", ".git", ".env", ".vscode", ".idea", "__pycache__"]
+
+_DETAIL_CHOICES = ("minimal", "basic", "full")
+
+# Maps every accepted flag spelling to its destination attribute.
+_FLAGS = {
+    "-p": "path", "--path": "path",
+    "-r": "recursive", "--recursive": "recursive",
+    "-i": "ignore", "--ignore": "ignore",
+    "-e": "exclude", "--exclude": "exclude",
+    "-d": "detail", "--detail": "detail",
+    "-j": "jobs", "--jobs": "jobs",
+    "-pe": "persistent", "--persistent": "persistent",
+}
+
+
+@dataclass
+class Arguments:
+    """Parsed command line arguments, same attributes as the argparse namespace"""
+    path: Path = field(default_factory=Path.cwd)
+    recursive: bool = True
+    ignore: list[Path] = field(default_factory=list)
+    exclude: list[str] = field(default_factory=lambda: list(_DEFAULT_EXCLUDES))
+    detail: str = "basic"
+    jobs: int = 0
+    persistent: bool = False
+
+
+def parse_arguments(argv: list[str]) -> Arguments | None:
+    """
+    Parse the fixed flag schema by hand; argparse and its import cascade are
+    only worth paying for the help/error paths. Returns None whenever the
+    input needs argparse (help requested, or anything this parser cannot
+    accept) so the caller can fall back to it for identical messages.
+    """
+
+    args = Arguments()
+
+    i = 0
+    while i < len(argv):
+        token = argv[i]
+
+        if token.startswith("--") and "=" in token:
+            flag, value = token.split("=", 1)
+            i += 1
+        else:
+            flag = token
+            if i + 1 >= len(argv):
+                return None
+            value = argv[i + 1]
+            i += 2
+
+        dest = _FLAGS.get(flag)
+
+        if dest is None:
+            return None
+
+        if dest == "path":
+            args.path = Path(value)
+        elif dest in ("recursive", "persistent"):
+            if value.lower() in _TRUE_VALUES:
+                setattr(args, dest, True)
+            elif value.lower() in _FALSE_VALUES:
+                setattr(args, dest, False)
+            else:
+                return None
+        elif dest == "ignore":
+            args.ignore.append(Path(value))
+        elif dest == "exclude":
+            args.exclude.append(value)
+        elif dest == "detail":
+            if value not in _DETAIL_CHOICES:
+                return None
+            args.detail = value
+        else:  # jobs
+            try:
+                args.jobs = int(value)
+            except ValueError:
+                return None
+
+    return args
+
 
 def init_argument_parser() -> argparse.ArgumentParser:
     """
@@ -15,6 +106,11 @@ def init_argument_parser() -> argparse.ArgumentParser:
     :return: The argument parser
     """
 
+    # Imported here so that the (comparatively heavy) argparse import is
+    # only paid when the parser is actually built: the common path parses
+    # the flags by hand in parse_arguments.
+    import argparse
+
     class StoreBoolAction(argparse.Action):
         def __call__(self,
                      parser_: argparse.ArgumentParser,
@@ -89,6 +185,15 @@ def init_argument_parser() -> argparse.ArgumentParser:
         choices=["minimal", "basic", "full"]
     )
 
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        help="How many worker threads to count files with. Defaults to four per CPU core (capped at 32).",
+        required=False,
+        default=0
+    )
+
     parser.add_argument(
         "-pe",
         "--persistent",
@@ -101,6 +206,30 @@ def init_argument_parser() -> argparse.ArgumentParser:
     return parser
 
 
+class _StatCache:
+    """
+    Caches os.stat results so each path is stat'ed at most once per run.
+    A CLI run never needs invalidation.
+    """
+
+    def __init__(self) -> None:
+        self._cache: dict[Path, os.stat_result | bool] = {}
+
+    def stat(self, path: Path) -> os.stat_result | bool:
+        """The cached stat result for path, or False if it does not exist."""
+        result = self._cache.get(path)
+        if result is None:
+            try:
+                result = os.stat(path)
+            except OSError:
+                result = False
+            self._cache[path] = result
+        return result
+
+    def exists(self, path: Path) -> bool:
+        return self.stat(path) is not False
+
+
 def validate_settings(settings: Settings) -> bool:
     """
     Validate the settings
@@ -108,13 +237,17 @@ def validate_settings(settings: Settings) -> bool:
     :raises FileNotFoundError: If the path does not exist
     """
 
+    # One stat per distinct path, even when the root also appears in the
+    # ignore paths.
+    statCache = _StatCache()
+
     # Check if path exists
-    if not settings.path.exists():
+    if not statCache.exists(settings.path):
         print(f"ERROR: Path '{settings.path}' does not exist.")
         return False
 
     for path in settings.ignorePaths:
-        if not path.exists():
+        if not statCache.exists(path):
             print(f"ERROR: Path in ignore paths '{path}' does not exist.")
             return False
 
@@ -122,6 +255,10 @@ def validate_settings(settings: Settings) -> bool:
         print(f"ERROR: Invalid output detail '{settings.outputDetail}'.")
         return False
 
+    if settings.jobs < 0:
+        print(f"ERROR: Invalid number of jobs '{settings.jobs}'.")
+        return False
+
     return True
 
 
@@ -134,9 +271,10 @@ def count_lines(settings: Settings) -> LineCounter | None:
     print(f"Counting lines in '{settings.path}'...")
     lineCounter = LineCounter(settings=settings)
 
-    # Get the files
+    # Get the files; iter_py_files streams them into count_files so the walk
+    # overlaps the counting and the full list is never materialized.
     try:
-        files = lineCounter.get_py_files(settings.path)
+        files = lineCounter.iter_py_files(settings.path)
     except ValueError:
         # Path is a file that is not a python file,
         # 'If path is not a directory or a python file'
@@ -147,7 +285,7 @@ def count_lines(settings: Settings) -> LineCounter | None:
     try:
         lineCounter.count_files(files)
     except FileNotFoundError as e:
-        print(f"ERROR: Couldn't open file during counting: {e.args[0]} ")
+        print(f"ERROR: Couldn't open file during counting: {e.filename} ")
         return
     except CommentNotClosedError as e:
         print(f"ERROR: .py file {e.args[0]} contains invalid code. Couldn't count comments because multi-line "
@@ -176,49 +314,47 @@ def print_table(lineCounter: LineCounter) -> None:
             str(fileData.blankLines),
         ])
 
-    # Print table
-    print()
-
-    string = ""
-    paddingString = ""
-
-    for i, head in enumerate(header):
-        longestRowLength = max(
-            [len(row[i]) for row in rows] + [len(head)]
-        )
-
-        string += head.ljust(longestRowLength) + "  |  "
-        paddingString += " " * longestRowLength + "  |  "
-
-    print("_" * len(string.rstrip()))
-    print(string)
-    print(paddingString)
+    # Compute each column's width once, instead of rescanning every row for
+    # every cell printed.
+    widths = [
+        max(len(head), *(len(row[i]) for row in rows)) if rows else len(head)
+        for i, head in enumerate(header)
+    ]
+
+    headerString = "  |  ".join(head.ljust(width) for head, width in zip(header, widths)) + "  |  "
+    paddingString = "  |  ".join(" " * width for width in widths) + "  |  "
+
+    # Render the whole table into one buffer and write it with a single
+    # call, instead of one line-buffered print (and flush) per row.
+    out = [
+        "",
+        "_" * len(headerString.rstrip()),
+        headerString,
+        paddingString,
+    ]
 
     for row in rows:
-        string = ""
-
-        for i, cell in enumerate(row):
-            longestRowLength = max(
-                [len(row[i]) for row in rows] + [len(header[i])]
-            )
+        out.append("  |  ".join(cell.ljust(width) for cell, width in zip(row, widths)) + "  |  ")
 
-            string += cell.ljust(longestRowLength) + "  |  "
-
-        print(string)
+    out.append("")
+    sys.stdout.write("\n".join(out))
 
 
 def print_statistics(lineCounter: LineCounter) -> None:
-    totalLines = sum([fileData.totalLines for fileData in lineCounter.fileDatas])
-    totalComments = sum([fileData.commentLines for fileData in lineCounter.fileDatas])
-    totalCode = sum([fileData.codeLines for fileData in lineCounter.fileDatas])
-    totalBlank = sum([fileData.blankLines for fileData in lineCounter.fileDatas])
-
-    averageLines = f"{totalLines / len(lineCounter.fileDatas):.2f}"
-    averageComments = f"{totalComments / len(lineCounter.fileDatas):.2f}"
-    averageCode = f"{totalCode / len(lineCounter.fileDatas):.2f}"
-    averageBlank = f"{totalBlank / len(lineCounter.fileDatas):.2f}"
-
-    print(f"average per file ({len(lineCounter.fileDatas)} files):")
+    # The counter keeps running totals, so these are O(1) reads rather than
+    # a pass over fileDatas per total.
+    totalLines = lineCounter.totalLines
+    totalComments = lineCounter.commentLines
+    totalCode = lineCounter.codeLines
+    totalBlank = lineCounter.blankLines
+    fileCount = lineCounter.fileCount
+
+    averageLines = f"{totalLines / fileCount:.2f}"
+    averageComments = f"{totalComments / fileCount:.2f}"
+    averageCode = f"{totalCode / fileCount:.2f}"
+    averageBlank = f"{totalBlank / fileCount:.2f}"
+
+    print(f"average per file ({fileCount} files):")
     print(f"    lines:            {averageLines}")
     print(f"    comments:         {averageComments}")
     print(f"    code:             {averageCode}")
@@ -235,19 +371,14 @@ def print_statistics(lineCounter: LineCounter) -> None:
 def print_data(lineCounter: LineCounter) -> None:
     # Print the stats total
 
-    totalLines = sum([fileData.totalLines for fileData in lineCounter.fileDatas])
-    totalComments = sum([fileData.commentLines for fileData in lineCounter.fileDatas])
-    totalCode = sum([fileData.codeLines for fileData in lineCounter.fileDatas])
-    totalBlank = sum([fileData.blankLines for fileData in lineCounter.fileDatas])
-
     print()
 
     print(f"overall:")
-    print(f"    files counted:    {len(lineCounter.fileDatas)}")
-    print(f"    total lines:      {totalLines}")
-    print(f"    comments:         {totalComments}")
-    print(f"    code:             {totalCode}")
-    print(f"    blank lines:      {totalBlank}")
+    print(f"    files counted:    {lineCounter.fileCount}")
+    print(f"    total lines:      {lineCounter.totalLines}")
+    print(f"    comments:         {lineCounter.commentLines}")
+    print(f"    code:             {lineCounter.codeLines}")
+    print(f"    blank lines:      {lineCounter.blankLines}")
 
     if lineCounter.settings.outputDetail == "minimal":
         return
@@ -268,15 +399,20 @@ def main() -> None:
     Main function
     """
 
-    parser = init_argument_parser()
-    args = parser.parse_args()
+    args = parse_arguments(sys.argv[1:])
+
+    if args is None:
+        # Help was requested, or the fast parser hit something it doesn't
+        # accept; argparse produces the proper message either way.
+        args = init_argument_parser().parse_args()
 
     settings = Settings(
         args.path,
         args.exclude,
         args.ignore,
         args.recursive,
-        args.detail
+        args.detail,
+        args.jobs
     )
 
     result: bool = validate_settings(settings)
@@ -5,8 +5,9 @@ WARNING: The counter will not count a blank line at the end of the file. This is
 and is not a bug.
 """
 from errors import CommentNotClosedError
+from array import array
 from dataclasses import dataclass
-from typing import List, Literal
+from typing import Iterable, Iterator, Literal
 from pathlib import Path
 import os
 
@@ -15,6 +16,451 @@ Detail = Literal["minimal", "basic", "full"]
 
 PYTHON_FILE_EXTENSIONS = [".py"]
 
+# Every sigil the scanner cares about is plain ASCII, so files are scanned as
+# bytes: no decode pass and no per-line str allocation.
+_HASH = b"#"
+_TQ = b"'''"
+_DQ = b'"""'
+
+_BYTE_SIGILS = (_HASH, _TQ, _DQ)
+_STR_SIGILS = ("#", "'''", '"""')
+
+# Files larger than this are memory-mapped instead of read into a bytes
+# object; below it the mmap setup costs more than the copy it saves.
+_MMAP_THRESHOLD = 16 * 1024
+
+# 256-entry class table over a stripped line's first byte: 1 = '#' comment,
+# 2 = a quote (either kind — the triple checks accept both), 0 = anything
+# else. One table load replaces a chain of startswith calls per line.
+_COMMENT_CLASS = 1
+_QUOTE_CLASS = 2
+
+_FIRST_CHAR_CLASS = bytearray(256)
+_FIRST_CHAR_CLASS[0x23] = _COMMENT_CLASS
+_FIRST_CHAR_CLASS[0x27] = _QUOTE_CLASS
+_FIRST_CHAR_CLASS[0x22] = _QUOTE_CLASS
+
+# Flip on to re-check the per-file counter invariant (the four counters must
+# sum up) while working on the scanners; off by default so production runs
+# don't pay for it on every file.
+_VALIDATE = False
+
+# Lazily imported numpy module; None = not tried yet, False = not installed.
+_np = None
+
+# Compiled _scan_buffer; None = not tried yet, False = numba is unavailable.
+_numbaScan = None
+
+# The _counter C extension; None = not tried yet, False = not built.
+_cKernel = None
+
+
+def _c_kernel():
+    """
+    Import the optional _counter C extension on first use. Returns its
+    classify function, or None when the extension has not been built.
+    """
+    global _cKernel
+    if _cKernel is None:
+        try:
+            import _counter
+        except ImportError:
+            _cKernel = False
+        else:
+            _cKernel = _counter.classify
+    return _cKernel or None
+
+
+def _numpy():
+    """Import numpy on first use. Returns None when it is not installed."""
+    global _np
+    if _np is None:
+        try:
+            import numpy
+        except ImportError:
+            numpy = False
+        _np = numpy
+    return _np or None
+
+
+def _scan_buffer(buf) -> tuple[int, int, int, int, bool]:
+    """
+    Classify a whole buffer of uint8 bytes in a single tight pass. Written in
+    plain integer operations so that numba can compile it to native code; it
+    also runs (slowly) as-is, which is how test_counter.py exercises it when
+    numba is not installed.
+    :return: (total, comment, code, blank, inMultiLineComment)
+    """
+
+    n = len(buf)
+    total = comment = code = blank = 0
+    inMultiLineComment = False
+
+    # first/last track the first and last non-whitespace byte of the current
+    # line, i.e. the bounds that strip() would leave behind.
+    first = -1
+    last = -1
+    lineStart = 0
+
+    i = 0
+    while i <= n:
+        if i == n:
+            # A trailing terminator produces no extra empty line.
+            if lineStart == n:
+                break
+            c = 0
+            terminator = True
+        else:
+            c = buf[i]
+            terminator = c == 0x0A or c == 0x0D
+
+        if terminator:
+            total += 1
+
+            if first < 0:
+                if inMultiLineComment:
+                    comment += 1
+                else:
+                    blank += 1
+            elif buf[first] == 0x23:  # '#'
+                comment += 1
+            else:
+                startsTriple = False
+                endsTriple = False
+
+                if last - first >= 2:
+                    # Pack three bytes into one word and compare against the
+                    # two 24-bit constants ''' and """ branchlessly, instead
+                    # of three data-dependent byte compares.
+                    head = (int(buf[first]) << 16) | (int(buf[first + 1]) << 8) | int(buf[first + 2])
+                    tail = (int(buf[last - 2]) << 16) | (int(buf[last - 1]) << 8) | int(buf[last])
+
+                    startsTriple = head == 0x272727 or head == 0x222222
+                    endsTriple = tail == 0x272727 or tail == 0x222222
+
+                if startsTriple:
+                    comment += 1
+                    if not endsTriple:
+                        inMultiLineComment = not inMultiLineComment
+                elif inMultiLineComment:
+                    comment += 1
+                else:
+                    code += 1
+
+            first = -1
+            last = -1
+
+            # Treat \r\n as a single terminator, like splitlines does.
+            if i < n and buf[i] == 0x0D and i + 1 < n and buf[i + 1] == 0x0A:
+                i += 1
+
+            lineStart = i + 1
+        elif c != 0x20 and c != 0x09 and c != 0x0B and c != 0x0C:
+            if first < 0:
+                first = i
+            last = i
+
+        i += 1
+
+    return total, comment, code, blank, inMultiLineComment
+
+
+def _numba_scanner():
+    """
+    Compile _scan_buffer with numba on first use. Returns the compiled
+    function, or None when numba (or numpy) is not installed.
+    """
+    global _numbaScan
+    if _numbaScan is None:
+        if _numpy() is None:
+            _numbaScan = False
+        else:
+            try:
+                import numba
+            except ImportError:
+                _numbaScan = False
+            else:
+                # cache=True persists the compiled code on disk, so only the
+                # very first run ever pays the compilation cost.
+                _numbaScan = numba.njit(cache=True)(_scan_buffer)
+    return _numbaScan or None
+
+
+def _classify_mmap(f) -> tuple[tuple[int, int, int, int, bool] | None, bytes | None]:
+    """
+    Try to classify an open binary file through a zero-copy memory map.
+    Needs numpy (for the cheap is-it-ASCII scan) plus a kernel that consumes
+    buffers directly; returns (counts, None) on success, (None, data) when
+    the buffer turned out to be non-ASCII, and (None, None) when mapping is
+    not worth attempting — the caller falls back to read() in both cases.
+    """
+
+    np = _numpy()
+    if np is None:
+        return None, None
+
+    kernel = _c_kernel()
+    scan = _numba_scanner() if kernel is None else None
+    if kernel is None and scan is None:
+        return None, None
+
+    import mmap
+
+    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        arr = np.frombuffer(mm, dtype=np.uint8)
+        try:
+            if int(arr.max(initial=0)) >= 128:
+                # Non-ASCII: hand the bytes back for the text path.
+                return None, mm[:]
+
+            if kernel is not None:
+                return kernel(mm), None
+            return scan(arr), None
+        finally:
+            # Release the exported buffer so the map can close.
+            del arr
+    finally:
+        mm.close()
+
+
+def _classify_simple(data: bytes) -> tuple[int, int, int, int, bool]:
+    """
+    Classify a buffer that is known to contain no triple quotes (and no
+    carriage returns). With no multi-line comment state to track, the total
+    comes straight from bytes.count and each line only needs its first
+    non-whitespace byte inspected.
+    :return: (total, comment, code, blank, inMultiLineComment)
+    """
+
+    if not data:
+        return 0, 0, 0, 0, False
+
+    # bytes.count runs a SIMD-friendly C loop over the whole buffer.
+    total = data.count(b"\n")
+    if not data.endswith(b"\n"):
+        total += 1
+
+    comment = blank = 0
+
+    lines = data.split(b"\n")
+    if not lines[-1]:
+        # A trailing newline leaves an empty final piece that splitlines
+        # would not produce.
+        lines.pop()
+
+    for line in lines:
+        strippedLine = line.strip()
+        if not strippedLine:
+            blank += 1
+        elif strippedLine[0] == 0x23:  # '#'
+            comment += 1
+
+    return total, comment, total - comment - blank, blank, False
+
+
+def _classify_byte_lines(lines) -> tuple[int, int, int, int, bool]:
+    """
+    Classify an iterable of byte lines, dispatching each line on a single
+    table lookup of its first stripped byte instead of a chain of
+    startswith calls.
+    :return: (total, comment, code, blank, inMultiLineComment)
+    """
+
+    firstCharClass = _FIRST_CHAR_CLASS
+
+    totalLines = commentLines = codeLines = blankLines = 0
+    inMultiLineComment = False
+
+    for line in lines:
+        totalLines += 1
+
+        strippedLine = line.strip()
+
+        if not strippedLine:
+            if inMultiLineComment:
+                commentLines += 1
+            else:
+                blankLines += 1
+            continue
+
+        charClass = firstCharClass[strippedLine[0]]
+
+        if charClass == _COMMENT_CLASS:
+            commentLines += 1
+        elif charClass == _QUOTE_CLASS and (
+            strippedLine.startswith(_TQ) or strippedLine.startswith(_DQ)
+        ):
+            commentLines += 1
+            if not (strippedLine.endswith(_TQ) or strippedLine.endswith(_DQ)):
+                inMultiLineComment = not inMultiLineComment
+        elif inMultiLineComment:
+            commentLines += 1
+        else:
+            codeLines += 1
+
+    return totalLines, commentLines, codeLines, blankLines, inMultiLineComment
+
+
+def _classify_lines(lines, sigils=_BYTE_SIGILS) -> tuple[int, int, int, int, bool]:
+    """
+    Classify an iterable of lines one by one. Works on byte or str lines;
+    pass sigils of the matching type.
+    :return: (total, comment, code, blank, inMultiLineComment)
+    """
+
+    hashSigil, tripleSingle, tripleDouble = sigils
+
+    totalLines = commentLines = codeLines = blankLines = 0
+    inMultiLineComment = False
+
+    # loop through the lines
+    for line in lines:
+        totalLines += 1
+
+        # strip the line for whitespace
+        strippedLine = line.strip()
+
+        # check if the line is a comment
+        if strippedLine.startswith(hashSigil):
+            commentLines += 1
+            continue
+
+        elif strippedLine.startswith(tripleSingle) or strippedLine.startswith(tripleDouble):
+
+            # Check if the line ends with '''
+            if strippedLine.endswith(tripleSingle) or strippedLine.endswith(tripleDouble):
+                commentLines += 1
+
+            else:
+                inMultiLineComment = not inMultiLineComment
+                commentLines += 1
+
+            continue
+
+        elif inMultiLineComment:
+            commentLines += 1
+            continue
+
+        # check if the line is blank
+        elif not strippedLine:
+            blankLines += 1
+            continue
+        else:
+            # if the line is not a comment or blank, it is probably code.
+            codeLines += 1
+
+    return totalLines, commentLines, codeLines, blankLines, inMultiLineComment
+
+
+def _classify_numpy(np, data: bytes) -> tuple[int, int, int, int, bool]:
+    """
+    Classify a whole buffer in bulk with numpy. One vectorized pass finds the
+    first non-whitespace byte of every line; only the (rare) lines that start
+    with a quote are then fed through the multi-line comment state machine.
+    The caller guarantees the buffer contains no carriage returns, so lines
+    are exactly the pieces between b'\\n' bytes.
+    :return: (total, comment, code, blank, inMultiLineComment)
+    """
+
+    arr = np.frombuffer(data, dtype=np.uint8)
+    n = len(arr)
+
+    newlines = np.flatnonzero(arr == 0x0A)
+
+    starts = np.empty(len(newlines) + 1, dtype=np.int64)
+    starts[0] = 0
+    starts[1:] = newlines + 1
+    ends = np.empty(len(newlines) + 1, dtype=np.int64)
+    ends[:-1] = newlines
+    ends[-1] = n
+
+    # A trailing newline does not produce a final empty line (splitlines
+    # behaves the same way).
+    if starts[-1] == n:
+        starts = starts[:-1]
+        ends = ends[:-1]
+
+    total = len(starts)
+
+    if total == 0:
+        return 0, 0, 0, 0, False
+
+    # Positions of every byte that bytes.strip() would keep.
+    whitespace = (
+        (arr == 0x20) | (arr == 0x09) | (arr == 0x0A)
+        | (arr == 0x0B) | (arr == 0x0C) | (arr == 0x0D)
+    )
+    nonspace = np.flatnonzero(~whitespace)
+
+    if len(nonspace) == 0:
+        # Nothing but whitespace: every line is blank.
+        return total, 0, 0, total, False
+
+    # First non-whitespace byte at or after each line start; a line is blank
+    # when that byte falls past the line's end.
+    firstIndex = np.searchsorted(nonspace, starts, side="left")
+    firstPos = np.where(
+        firstIndex < len(nonspace),
+        nonspace[np.minimum(firstIndex, len(nonspace) - 1)],
+        n,
+    )
+    blankMask = firstPos >= ends
+    firstChar = np.where(blankMask, 0, arr[np.minimum(firstPos, n - 1)])
+
+    hashMask = firstChar == 0x23  # '#'
+    quoteLines = np.flatnonzero((firstChar == 0x27) | (firstChar == 0x22))
+
+    # Last non-whitespace byte of each line, for the endswith check on the
+    # quote-starting lines.
+    lastIndex = np.searchsorted(nonspace, ends, side="left")
+    lastPos = nonspace[np.maximum(lastIndex - 1, 0)]
+
+    # Prefix sums let each stretch of lines between two quote lines be
+    # accounted for without visiting its lines individually.
+    hashCum = np.concatenate(([0], np.cumsum(hashMask)))
+    blankCum = np.concatenate(([0], np.cumsum(blankMask)))
+
+    comment = code = blank = 0
+    inMultiLineComment = False
+    nextLine = 0
+
+    def tallyRange(begin: int, end: int) -> tuple[int, int, int]:
+        """Tally the lines in [begin, end), none of which start with a quote."""
+        if inMultiLineComment:
+            # Everything that is not a '#' line counts as comment too (and
+            # the '#' lines were comments anyway).
+            return end - begin, 0, 0
+        hashCount = int(hashCum[end] - hashCum[begin])
+        blankCount = int(blankCum[end] - blankCum[begin])
+        return hashCount, (end - begin) - hashCount - blankCount, blankCount
+
+    for lineIndex in map(int, quoteLines):
+        rangeComment, rangeCode, rangeBlank = tallyRange(nextLine, lineIndex)
+        comment += rangeComment
+        code += rangeCode
+        blank += rangeBlank
+
+        strippedLine = data[firstPos[lineIndex]:lastPos[lineIndex] + 1]
+
+        if strippedLine.startswith(_TQ) or strippedLine.startswith(_DQ):
+            comment += 1
+            if not (strippedLine.endswith(_TQ) or strippedLine.endswith(_DQ)):
+                inMultiLineComment = not inMultiLineComment
+        elif inMultiLineComment:
+            comment += 1
+        else:
+            code += 1
+
+        nextLine = lineIndex + 1
+
+    rangeComment, rangeCode, rangeBlank = tallyRange(nextLine, total)
+    comment += rangeComment
+    code += rangeCode
+    blank += rangeBlank
+
+    return total, comment, code, blank, inMultiLineComment
+
 
 def _zero_safe_division(numerator: int, denominator: int) -> float:
     """Zero safe division"""
@@ -28,10 +474,11 @@ def _zero_safe_division(numerator: int, denominator: int) -> float:
 class Settings:
     """Settings information payload"""
     path: Path
-    ignoreNames: List[str]
-    ignorePaths: List[Path]
+    ignoreNames: list[str]
+    ignorePaths: list[Path]
     recursive: bool
     outputDetail: Detail
+    jobs: int = 0  # worker threads for counting; 0 picks a sensible default
 
 
 @dataclass
@@ -57,7 +504,41 @@ def get_arbitrary_settings() -> Settings:
 class LineCounter:
     def __init__(self, settings: Settings) -> None:
         self._settings: Settings = settings
-        self._fileDatas: list[FileData] = []
+
+        # Per-file counters are stored column-wise (structure of arrays):
+        # four flat int64 arrays instead of a list of FileData objects.
+        # Aggregating a column is then one C-level loop over contiguous
+        # memory rather than an attribute load per object.
+        self._files: list[Path] = []
+        self._totalLines = array("q")
+        self._commentLines = array("q")
+        self._codeLines = array("q")
+        self._blankLines = array("q")
+
+        # Running totals, maintained by _append so that aggregate reads are
+        # O(1) instead of a pass over the columns per total.
+        self._totalLineCount = 0
+        self._commentLineCount = 0
+        self._codeLineCount = 0
+        self._blankLineCount = 0
+
+        # Frozen once so every ignore lookup during the walk is O(1) instead
+        # of a list scan per directory entry.
+        self._ignoreNames: frozenset[str] = frozenset(settings.ignoreNames)
+        self._ignorePaths: frozenset[Path] = frozenset(settings.ignorePaths)
+
+    def _append(self, fileData: FileData) -> None:
+        """Record a counted file into the column arrays."""
+        self._files.append(fileData.file)
+        self._totalLines.append(fileData.totalLines)
+        self._commentLines.append(fileData.commentLines)
+        self._codeLines.append(fileData.codeLines)
+        self._blankLines.append(fileData.blankLines)
+
+        self._totalLineCount += fileData.totalLines
+        self._commentLineCount += fileData.commentLines
+        self._codeLineCount += fileData.codeLines
+        self._blankLineCount += fileData.blankLines
 
     def count_file(self, file: Path) -> None:
         """
@@ -65,132 +546,188 @@ class LineCounter:
         :raises FileNotFoundError: If file does not exist
         :raises CommentNotClosedError: If multi-line comment is not closed
         """
+        self._append(self._count_file_pure(file))
 
-        fileData = FileData(file, 0, 0, 0, 0)
-
-        # Open the file
-        with open(file, "r") as f:
-            # Get the lines
-            lines = f.read().splitlines()
-
-        inMultiLineComment = False
-
-        # loop through the lines
-        for line in lines:
-            fileData.totalLines += 1
-
-            # strip the line for whitespace
-            strippedLine = line.strip()
-
-            # check if the line is a comment
-            if strippedLine.startswith("#"):
-                fileData.commentLines += 1
-                continue
+    def _count_file_pure(self, file: Path) -> FileData:
+        """
+        Count a single file and return its FileData. Touches no shared state,
+        so it is safe to run from worker threads.
+        :raises FileNotFoundError: If file does not exist
+        :raises CommentNotClosedError: If multi-line comment is not closed
+        """
 
-            elif strippedLine.startswith("'''") or strippedLine.startswith('"""'):
+        # Open the file in binary mode; the sigils we look for are ASCII, so
+        # there is no need to decode the file first.
+        counts = None
+        data = None
+
+        with open(file, "rb") as f:
+            if os.fstat(f.fileno()).st_size > _MMAP_THRESHOLD:
+                # Large file: scan it through a zero-copy memory map when a
+                # buffer-capable kernel is available.
+                counts, data = _classify_mmap(f)
+
+            if counts is None and data is None:
+                data = f.read()
+
+        # data.isascii() is a cheap C-level check, and every sigil the byte
+        # kernels look for is ASCII. The rare non-ASCII file is decoded and
+        # classified with str semantics instead, so that Unicode whitespace
+        # strips the way it would in text mode.
+        if counts is None and not data.isascii():
+            import io
+
+            # Iterate a TextIOWrapper instead of decoding the whole buffer
+            # and materializing a line list: it decodes and yields one line
+            # at a time, so peak memory on this path is one line, not the
+            # full str plus its splitlines.
+            try:
+                counts = _classify_lines(
+                    io.TextIOWrapper(io.BytesIO(data), encoding="utf-8"),
+                    _STR_SIGILS,
+                )
+            except UnicodeDecodeError:
+                pass  # undecodable; scan the raw bytes below
 
-                # Check if the line ends with '''
-                if strippedLine.endswith("'''") or strippedLine.endswith('"""'):
-                    fileData.commentLines += 1
+        if counts is None:
+            kernel = _c_kernel()
 
+            if kernel is not None:
+                counts = kernel(data)
+            else:
+                np = _numpy()
+                scan = _numba_scanner()
+
+                if scan is not None:
+                    counts = scan(np.frombuffer(data, dtype=np.uint8))
+                # Most files contain no triple quotes at all; checking that
+                # is a single SIMD substring search each, and it lets the
+                # multi-line comment tracking be skipped entirely. Buffers
+                # with carriage returns fall through to the per-line loop,
+                # whose splitlines semantics the bulk paths don't reproduce.
+                elif b"\r" not in data and _TQ not in data and _DQ not in data:
+                    counts = _classify_simple(data)
+                elif np is not None and b"\r" not in data:
+                    counts = _classify_numpy(np, data)
                 else:
-                    inMultiLineComment = not inMultiLineComment
-                    fileData.commentLines += 1
-
-                continue
+                    counts = _classify_byte_lines(data.splitlines())
 
-            elif inMultiLineComment:
-                fileData.commentLines += 1
-                continue
-
-            # check if the line is blank
-            elif strippedLine == "":
-                fileData.blankLines += 1
-                continue
-            else:
-                # if the line is not a comment or blank, it is probably code.
-                fileData.codeLines += 1
+        totalLines, commentLines, codeLines, blankLines, inMultiLineComment = counts
 
         # raise if inMultiLineComment is True
         if inMultiLineComment:
             raise CommentNotClosedError(file)
 
-        assert fileData.totalLines == fileData.commentLines + fileData.codeLines + fileData.blankLines
+        fileData = FileData(file, totalLines, commentLines, codeLines, blankLines)
+
+        if __debug__ and _VALIDATE:
+            assert totalLines == commentLines + codeLines + blankLines
 
-        self._fileDatas.append(fileData)
+        return fileData
 
     def get_py_files(self, path: Path) -> list[Path]:
         """
         Get all python files in a path.
         :raises ValueError: If path is not a directory or a python file
         """
+        return list(self.iter_py_files(path))
+
+    def iter_py_files(self, path: Path) -> Iterator[Path]:
+        """
+        Iterate over all python files in a path lazily, so counting can start
+        before the whole tree has been walked and the file list never has to
+        be held in memory.
+        :raises ValueError: If path is not a directory or a python file
+        """
 
         if path.is_file():
             # Check if it is a python file, and return it if it is
             if path.suffix in PYTHON_FILE_EXTENSIONS:
-                return [path]
+                return iter((path,))
 
             else:
                 raise ValueError(f"Path '{path}' is not a directory or a python file.")
 
-        files = []
-
-        for file in path.iterdir():
-            if file.is_dir():
-                if file.name in self._settings.ignoreNames:
-                    continue
-
-                if file in self._settings.ignorePaths:
-                    continue
-
-                if not self._settings.recursive:
-                    continue
+        return self._walk_py_files(path)
 
-                # If file is directory, and it's not in the ignoreNames list and ignorePaths list, then get the files
-                # in the directory
+    def _walk_py_files(self, path: Path) -> Iterator[Path]:
+        """Generator behind iter_py_files for the directory case."""
 
-                files += self.get_py_files(file)
+        ignoreNames = self._ignoreNames
+        ignorePaths = self._ignorePaths
 
-            elif file.is_file():
+        # os.walk is scandir-based, so directory entries arrive with their
+        # file type already known — no extra stat() per entry. Pruning dirs
+        # in place stops the walk from ever descending into ignored trees.
+        for root, dirs, names in os.walk(path):
+            dirs[:] = [
+                d for d in dirs
+                if d not in ignoreNames and Path(root, d) not in ignorePaths
+            ]
 
-                if file.suffix not in PYTHON_FILE_EXTENSIONS:
+            for name in names:
+                if not name.endswith(".py"):
                     continue
 
-                if file.name in self._settings.ignoreNames:
+                if name in ignoreNames:
                     continue
 
-                if file in self._settings.ignorePaths:
-                    continue
+                file = Path(root, name)
 
-                # If file is a file, and it's not in the ignoreNames list and ignorePaths list, then append it to the
-                # files list
+                if file in ignorePaths:
+                    continue
 
-                files.append(file)
+                yield file
 
-        return files
+            if not self._settings.recursive:
+                break
 
-    def count_files(self, files: list[Path]) -> None:
+    def count_files(self, files: Iterable[Path]) -> None:
         """
         Count all the files provided.
         :raises FileNotFoundError: If file does not exist
         :raises CommentNotClosedError: If multi-line comment is not closed
         """
 
-        for file in files:
-            if not file.exists():
-                raise FileNotFoundError(
-                    f"File '{file}' does not exist. Please check that the file exists, and try again."
-                )
+        # Deferred imports: the thread pool is only needed once we actually
+        # count something.
+        from collections import deque
+        from concurrent.futures import ThreadPoolExecutor
+        from itertools import islice
+
+        # Counting a file is dominated by open()+read(), during which the GIL
+        # is released, so fanning out over threads overlaps the I/O. No
+        # exists() pre-check here: open() raises FileNotFoundError itself,
+        # and the check cost a stat() per file.
+        workers = self._settings.jobs or min(32, (os.cpu_count() or 1) * 4)
+
+        fileIterator = iter(files)
 
-            self.count_file(file)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Submit in a bounded window rather than via executor.map, which
+            # would eagerly create one Future per file and so materialize the
+            # whole input anyway. The deque is FIFO, so fileDatas stays in
+            # the same order as the files argument.
+            pending = deque(
+                executor.submit(self._count_file_pure, file)
+                for file in islice(fileIterator, workers * 2)
+            )
+
+            while pending:
+                fileData = pending.popleft().result()
+
+                for file in islice(fileIterator, 1):
+                    pending.append(executor.submit(self._count_file_pure, file))
+
+                self._append(fileData)
 
     def print_file_data(self) -> None:
         """Print the file data"""
-        if len(self._fileDatas) == 0:
+        if len(self._files) == 0:
             print("No files to print.")
             return
 
-        for file in self._fileDatas:
+        for file in self.fileDatas:
             print(f"{file.file}")
             print(f"    total lines:    {file.totalLines}")
             print(f"    comment lines:  {file.commentLines}")
@@ -201,10 +738,10 @@ class LineCounter:
 
         print("Total:")
 
-        totalLines = sum([file.totalLines for file in self._fileDatas])
-        commentLines = sum([file.commentLines for file in self._fileDatas])
-        codeLines = sum([file.codeLines for file in self._fileDatas])
-        blankLines = sum([file.blankLines for file in self._fileDatas])
+        totalLines = self._totalLineCount
+        commentLines = self._commentLineCount
+        codeLines = self._codeLineCount
+        blankLines = self._blankLineCount
 
         print(f"    total lines:    {totalLines}")
         print(f"    comment lines:  {commentLines}")
@@ -217,6 +754,39 @@ class LineCounter:
     def settings(self) -> Settings:
         return self._settings
 
+    @property
+    def fileCount(self) -> int:
+        return len(self._files)
+
+    @property
+    def totalLines(self) -> int:
+        return self._totalLineCount
+
+    @property
+    def commentLines(self) -> int:
+        return self._commentLineCount
+
+    @property
+    def codeLines(self) -> int:
+        return self._codeLineCount
+
+    @property
+    def blankLines(self) -> int:
+        return self._blankLineCount
+
     @property
     def fileDatas(self) -> list[FileData]:
-        return self._fileDatas
+        """
+        Per-file results as FileData rows. Materialized from the column
+        arrays on access; aggregate over the arrays instead where possible.
+        """
+        return [
+            FileData(file, total, comment, code, blank)
+            for file, total, comment, code, blank in zip(
+                self._files,
+                self._totalLines,
+                self._commentLines,
+                self._codeLines,
+                self._blankLines,
+            )
+        ]
@@ -0,0 +1,21 @@
+"""
+Build script for the optional native counting kernel.
+
+    python setup.py build_ext --inplace
+
+counter.py works without it; when the extension is present it is picked up
+automatically.
+"""
+
+from setuptools import setup, Extension
+
+setup(
+    name="countmylines",
+    ext_modules=[
+        Extension(
+            "_counter",
+            sources=["_counter.c"],
+            extra_compile_args=["-O3"],
+        )
+    ],
+)
@@ -0,0 +1,152 @@
+"""
+Scanner agreement tests.
+
+counter.py carries several implementations of the same line classification
+(the per-line reference loop, the table-driven byte loop, the quote-free
+fast path, the numpy bulk pass, the _scan_buffer kernel that numba compiles,
+and the _counter C extension). They must agree byte for byte, so each one is
+fuzzed here against the reference loop over random line/terminator mixes.
+
+Runs under pytest, or directly: python test_counter.py
+The optional-dependency tests pass trivially where numpy/numba/_counter are
+not installed.
+"""
+
+import random
+
+from counter import (
+    _STR_SIGILS,
+    _c_kernel,
+    _classify_byte_lines,
+    _classify_lines,
+    _classify_numpy,
+    _classify_simple,
+    _numba_scanner,
+    _numpy,
+    _scan_buffer,
+)
+
+# Line shapes that cover every branch: comments, code, blanks, exotic
+# whitespace, and all the triple-quote corner cases (lone ''', quad quotes,
+# mixed quote types, quotes mid-line).
+PIECES = [
+    "", " ", "\t", "   ", "\f", "\x0b",
+    "#", "# hi", "a#b", "  \t # mixed",
+    "x = 1", "ab", "'x'", '"y"', "''", '""',
+    "'''", '"""', "''''", "'''doc'''", "'''open", "close'''",
+    '"""open', 'close"""', "  '''  ", "q'''r", "'''\"\"\"", "'\"'",
+]
+
+QUOTE_FREE_PIECES = [p for p in PIECES if "'''" not in p and '"""' not in p]
+
+TERMINATORS = ["\n", "\r", "\r\n"]
+
+
+def _random_buffers(seed, trials, pieces, terminators):
+    """Yield random byte buffers assembled from pieces and terminators."""
+    rng = random.Random(seed)
+
+    for _ in range(trials):
+        body = "".join(
+            rng.choice(pieces) + rng.choice(terminators)
+            for _ in range(rng.randrange(0, 12))
+        )
+        if rng.random() < 0.5:
+            body += rng.choice(pieces)
+
+        yield body.encode()
+
+
+def _reference(data):
+    """Classify data with the reference per-line loop."""
+    counts = _classify_lines(data.splitlines())
+
+    # The counters must always sum up, whatever the implementation says.
+    total, comment, code, blank, _ = counts
+    assert total == comment + code + blank
+
+    return tuple(counts)
+
+
+def test_known_cases():
+    """Pin the (quirky) multi-line comment semantics of the original loop."""
+    cases = {
+        b"": (0, 0, 0, 0, False),
+        b"\n\n\n": (3, 0, 0, 3, False),
+        b"x = 1\n# c\n\n": (3, 1, 1, 1, False),
+        b"x = 1\n# c\ny = 2": (3, 1, 2, 0, False),
+        # A lone ''' both starts and ends with ''', so it never toggles.
+        b"'''\nhello\n": (2, 1, 1, 0, False),
+        # Toggling on requires a quote-started line that doesn't end on one,
+        # and the same again to toggle off.
+        b"'''open\ninside\n# hash\n\n''' end\nx = 1\n": (6, 5, 1, 0, False),
+        b"'''open\nnever closed\n": (2, 2, 0, 0, True),
+    }
+
+    for data, expected in cases.items():
+        assert _reference(data) == expected, data
+
+
+def test_byte_lines_agree():
+    for data in _random_buffers(1, 4000, PIECES, TERMINATORS):
+        assert tuple(_classify_byte_lines(data.splitlines())) == _reference(data), data
+
+
+def test_simple_agrees_on_quote_free():
+    # _classify_simple is only ever called on \r-free, triple-quote-free data.
+    for data in _random_buffers(2, 4000, QUOTE_FREE_PIECES, ["\n"]):
+        assert tuple(_classify_simple(data)) == _reference(data), data
+
+
+def test_scan_buffer_agrees():
+    # bytes index as ints, so the kernel runs as-is without numpy.
+    for data in _random_buffers(3, 4000, PIECES, TERMINATORS):
+        assert tuple(_scan_buffer(data)) == _reference(data), data
+
+
+def test_str_sigils_agree():
+    import io
+
+    # Mirror the production text path: iterate a TextIOWrapper, whose
+    # universal newlines split like the byte scanners do (str.splitlines
+    # would additionally break on \f and \v).
+    for data in _random_buffers(4, 2000, PIECES, TERMINATORS):
+        lines = io.TextIOWrapper(io.BytesIO(data), encoding="utf-8")
+        assert tuple(_classify_lines(lines, _STR_SIGILS)) == _reference(data), data
+
+
+def test_numpy_kernel_agrees():
+    np = _numpy()
+    if np is None:
+        return
+
+    # _classify_numpy is only ever called on \r-free data.
+    for data in _random_buffers(5, 4000, PIECES, ["\n"]):
+        assert tuple(_classify_numpy(np, data)) == _reference(data), data
+
+
+def test_numba_kernel_agrees():
+    scan = _numba_scanner()
+    if scan is None:
+        return
+
+    np = _numpy()
+    for data in _random_buffers(6, 400, PIECES, TERMINATORS):
+        arr = np.frombuffer(data, dtype=np.uint8)
+        assert tuple(scan(arr)) == _reference(data), data
+
+
+def test_c_kernel_agrees():
+    kernel = _c_kernel()
+    if kernel is None:
+        return
+
+    for data in _random_buffers(7, 4000, PIECES, TERMINATORS):
+        assert tuple(kernel(data)) == _reference(data), data
+
+
+if __name__ == "__main__":
+    for name, test in sorted(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"{name} OK")